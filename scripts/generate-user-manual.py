@@ -10,18 +10,71 @@ import sys
 import re
 import argparse
 import datetime
+import functools
+import itertools
+import mmap
+import stat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+REQUIRED_SECTIONS = (
+    "Overview",
+    "Device Setup",
+    "Feature Guide",
+    "Troubleshooting",
+    "Safety Guidelines",
+)
+
+# Patterns are compiled on first use and then reused, so importing the
+# script or running --help does not pay for them
+@functools.lru_cache(maxsize=None)
+def _h2_re() -> re.Pattern:
+    """Regex capturing the title of every second-level header."""
+    # Greedy capture to end of line never backtracks into the padding; the
+    # surrounding whitespace is stripped by the caller
+    return re.compile(r'^##[ \t]+(.+)$', re.MULTILINE)
+
+@functools.lru_cache(maxsize=None)
+def _placeholder_res() -> Tuple[re.Pattern, ...]:
+    """Regexes for leftover placeholder content, one per kind.
+
+    Each kind is scanned separately: a literal-prefixed pattern lets ``re``
+    skip ahead far faster than one alternation tried at every position, and
+    markers nested inside other placeholders (``[TODO: fill]``) are still
+    found. Bounded lazy bodies cap backtracking at 200 characters.
+    """
+    return (
+        re.compile(r"\{\{.{0,200}?\}\}"),
+        re.compile(r"\[.{0,200}?\]"),
+        re.compile(r"TODO"),
+        re.compile(r"FIXME"),
+    )
+
+@functools.lru_cache(maxsize=None)
+def _replacement_re(keys: frozenset) -> re.Pattern:
+    """Build (and cache) a regex matching any {{key}} for the given keys."""
+    return re.compile(r'\{\{(' + '|'.join(map(re.escape, sorted(keys))) + r')\}\}')
+
+# Templates at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+# Output directories already created by this process
+_MKDIR_SEEN: Set[str] = set()
+
+def _ensure_dir(directory: str) -> None:
+    """Create an output directory once per process."""
+    if directory and directory not in _MKDIR_SEEN:
+        os.makedirs(directory, exist_ok=True)
+        _MKDIR_SEEN.add(directory)
+
+@functools.lru_cache(maxsize=1)
+def _today_str(day: datetime.date) -> str:
+    """Format the manual date once per calendar day."""
+    return day.isoformat()
 
 class UserManualGenerator:
     def __init__(self):
-        self.required_sections = [
-            "Overview",
-            "Device Setup", 
-            "Feature Guide",
-            "Troubleshooting",
-            "Safety Guidelines"
-        ]
+        self.required_sections = list(REQUIRED_SECTIONS)
         
         self.validation_errors = []
         self.validation_warnings = []
@@ -29,23 +82,47 @@ class UserManualGenerator:
     def load_template(self, template_path: str) -> str:
         """Load the user manual template file."""
         try:
-            with open(template_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            # Raw reads sized from fstat instead of the text-mode reader (or,
+            # for large regular files, a memory map decoded without an
+            # intermediate bytes copy)
+            fd = os.open(template_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                info = os.fstat(fd)
+                if stat.S_ISREG(info.st_mode) and info.st_size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                        content = str(mapped, 'utf-8')
+                else:
+                    # Read until EOF: pipes and procfs files report size 0
+                    # and any read may return short
+                    chunks = []
+                    chunk_size = max(info.st_size, 1 << 16)
+                    while True:
+                        chunk = os.read(fd, chunk_size)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                    content = b''.join(chunks).decode('utf-8')
+            finally:
+                os.close(fd)
+            # Keep the universal-newline behaviour of text mode
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return content
         except FileNotFoundError:
             self.validation_errors.append(f"Template file not found: {template_path}")
             return ""
         except Exception as e:
-            self.validation_errors.append(f"Error reading template: {str(e)")
+            self.validation_errors.append(f"Error reading template: {str(e)}")
             return ""
     
     def validate_template_structure(self, content: str) -> bool:
         """Validate that the template contains all required sections."""
         valid = True
         
+        # One pass collects every section header, then set lookups
+        found = {title.strip() for title in _h2_re().findall(content)}
         for section in self.required_sections:
-            # Look for section headers (## followed by section name)
-            pattern = rf'^##\s+{re.escape(section)}\s*$'
-            if not re.search(pattern, content, re.MULTILINE):
+            if section not in found:
                 self.validation_errors.append(f"Missing required section: {section}")
                 valid = False
         
@@ -55,12 +132,12 @@ class UserManualGenerator:
         """Perform basic content quality checks."""
         valid = True
         
-        # Check for placeholder content
-        placeholders = ["{{.*?}}", "\[.*?\]", "TODO", "FIXME"]
-        for placeholder in placeholders:
-            matches = re.findall(placeholder, content)
+        # Check for placeholder content; only the first three matches of each
+        # kind are reported, so stop scanning there
+        for pattern in _placeholder_res():
+            matches = [match.group() for match in itertools.islice(pattern.finditer(content), 3)]
             if matches:
-                self.validation_warnings.append(f"Found placeholder content: {matches[:3]}")
+                self.validation_warnings.append(f"Found placeholder content: {matches}")
         
         # Check minimum content length
         if len(content.strip()) < 1000:
@@ -71,21 +148,22 @@ class UserManualGenerator:
     def generate_manual(self, template_content: str, output_path: str, **replacements) -> bool:
         """Generate the final user manual with replacements."""
         try:
-            # Apply replacements
+            # Apply all replacements in a single pass over the template
             manual_content = template_content
-            for key, value in replacements.items():
-                manual_content = manual_content.replace(f"{{{{{key}}}}}", str(value))
+            if replacements:
+                # Convert each value once rather than on every match
+                values = {key: str(value) for key, value in replacements.items()}
+                pattern = _replacement_re(frozenset(values))
+                manual_content = pattern.sub(lambda m: values[m.group(1)], template_content)
             
             # Ensure output directory exists
-            output_dir = os.path.dirname(output_path)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
+            _ensure_dir(os.path.dirname(output_path))
             
-            # Write the generated manual
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write(manual_content)
+            # Encode once and write the generated manual in a single binary write
+            data = manual_content.encode('utf-8')
+            with open(output_path, 'wb') as file:
+                file.write(data)
             
-            print(f"✓ User manual generated: {output_path}")
             return True
             
         except Exception as e:
@@ -108,15 +186,104 @@ class UserManualGenerator:
     
     def generate_validation_summary(self) -> Dict:
         """Generate a summary of validation results."""
+        missing = {
+            error.split(': ', 1)[-1]
+            for error in self.validation_errors
+            if error.startswith("Missing required section")
+        }
         return {
             "errors": self.validation_errors,
             "warnings": self.validation_warnings,
             "is_valid": len(self.validation_errors) == 0,
-            "required_sections_present": all(
-                section in self.required_sections for section in self.required_sections
-            )
+            "required_sections_present": [
+                section for section in self.required_sections if section not in missing
+            ]
         }
 
+def _process_template(template_path: str, output_path: Optional[str],
+                      replacements: Dict[str, str]
+                      ) -> Tuple[str, Optional[str], bool, UserManualGenerator]:
+    """Load, validate and generate one template (batch worker).
+
+    No manual is written when output_path is None (validate-only mode).
+    Returns the template path, the path of the manual actually written (or
+    None), the overall result and the generator holding its messages; the
+    worker prints nothing so the parent can report templates in order.
+    """
+    generator = UserManualGenerator()
+    template_content = generator.load_template(template_path)
+    if not template_content:
+        return template_path, None, False, generator
+    
+    structure_valid = generator.validate_template_structure(template_content)
+    content_valid = generator.validate_content_quality(template_content)
+    success = True
+    if output_path is not None:
+        success = generator.generate_manual(template_content, output_path, **replacements)
+    generated = output_path if output_path is not None and success else None
+    
+    return template_path, generated, success and structure_valid and content_valid, generator
+
+def _batch_output_paths(template_dir: str, templates: List[str],
+                        output_dir: str) -> Tuple[List[str], List[str]]:
+    """Map templates to output paths mirroring their layout under template_dir.
+
+    Returns the output paths and a list of problems: outputs that would
+    overwrite one of the templates, or two templates sharing one output.
+    """
+    template_real = {os.path.realpath(path) for path in templates}
+    outputs: List[str] = []
+    seen: Dict[str, str] = {}
+    problems: List[str] = []
+    for template_path in templates:
+        output_path = os.path.join(output_dir, os.path.relpath(template_path, template_dir))
+        output_real = os.path.realpath(output_path)
+        if output_real in template_real:
+            problems.append(f"Output {output_path} would overwrite a template")
+        elif output_real in seen:
+            problems.append(f"{template_path} and {seen[output_real]} both write {output_path}")
+        else:
+            seen[output_real] = template_path
+        outputs.append(output_path)
+    return outputs, problems
+
+def run_batch(template_dir: str, pattern: str, output_dir: str, validate_only: bool,
+              replacements: Dict[str, str]) -> bool:
+    """Process every template matching pattern in parallel across CPU cores."""
+    templates = sorted(str(path) for path in Path(template_dir).glob(pattern) if path.is_file())
+    if not templates:
+        print(f"❌ No templates matching '{pattern}' in {template_dir}")
+        return False
+    
+    if validate_only:
+        outputs: List[Optional[str]] = [None] * len(templates)
+    else:
+        # Refuse the whole batch before any worker writes a file
+        outputs, problems = _batch_output_paths(template_dir, templates, output_dir)
+        if problems:
+            print("❌ Invalid batch output layout:")
+            for problem in problems:
+                print(f"  - {problem}")
+            return False
+    
+    # Imported here so single-template runs and --help skip multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    worker = functools.partial(_process_template, replacements=replacements)
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(worker, templates, outputs))
+    
+    all_valid = True
+    for template_path, generated, ok, generator in results:
+        print(f"\n{'✅' if ok else '❌'} {template_path}")
+        if generated:
+            print(f"✓ User manual generated: {generated}")
+        generator.run_validation_report()
+        all_valid = all_valid and ok
+    
+    print(f"\n📊 Batch Summary: {sum(ok for _, _, ok, _ in results)}/{len(results)} templates passed")
+    return all_valid
+
 def main():
     parser = argparse.ArgumentParser(description='Generate user manual from template')
     parser.add_argument('--template', '-t', default='docs/user-manual-template.md', 
@@ -127,9 +294,25 @@ def main():
                        help='Only validate template without generating output')
     parser.add_argument('--system-version', default='2.0.0',
                        help='System version to include in manual')
+    parser.add_argument('--batch', metavar='DIR',
+                       help='Process every template in DIR in parallel')
+    parser.add_argument('--pattern', default='*.md',
+                       help='Glob pattern for templates in batch mode')
+    parser.add_argument('--batch-output', default='docs/generated', metavar='DIR',
+                       help='Output directory for manuals generated in batch mode')
     
     args = parser.parse_args()
     
+    replacements = {
+        'CURRENT_DATE': _today_str(datetime.date.today()),
+        'SYSTEM_VERSION': args.system_version
+    }
+    
+    if args.batch:
+        ok = run_batch(args.batch, args.pattern, args.batch_output,
+                       args.validate_only, replacements)
+        sys.exit(0 if ok else 1)
+    
     generator = UserManualGenerator()
     
     # Load and validate template
@@ -149,12 +332,9 @@ def main():
         sys.exit(0 if structure_valid and content_valid else 1)
     
     # Generate manual with replacements
-    replacements = {
-        'CURRENT_DATE': datetime.datetime.now().strftime('%Y-%m-%d'),
-        'SYSTEM_VERSION': args.system_version
-    }
-    
     success = generator.generate_manual(template_content, args.output, **replacements)
+    if success:
+        print(f"✓ User manual generated: {args.output}")
     
     # Run validation report
     generator.run_validation_report()
@@ -0,0 +1,201 @@
+"""Tests for scripts/generate-user-manual.py."""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE = ROOT / "docs" / "user-manual-template.md"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location(
+        "generate_user_manual", ROOT / "scripts" / "generate-user-manual.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+gum = _load_script()
+
+REPLACEMENTS = {"CURRENT_DATE": "2024-01-01", "SYSTEM_VERSION": "9.9.9"}
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    # For in-process run_batch calls: the script is loaded from a file path,
+    # so worker processes could not import it under a non-fork start method.
+    # test_batch_cli_uses_worker_processes covers the real process pool.
+    monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", ThreadPoolExecutor)
+
+
+@pytest.fixture
+def template_tree(tmp_path):
+    templates = tmp_path / "templates"
+    (templates / "sub").mkdir(parents=True)
+    text = TEMPLATE.read_text(encoding="utf-8")
+    (templates / "a.md").write_text(text, encoding="utf-8")
+    (templates / "sub" / "a.md").write_text(text, encoding="utf-8")
+    return templates
+
+
+def test_run_batch_mirrors_template_layout(template_tree, tmp_path, thread_pool):
+    output = tmp_path / "out"
+
+    ok = gum.run_batch(str(template_tree), "**/*.md", str(output), False, REPLACEMENTS)
+
+    assert ok
+    for name in ("a.md", "sub/a.md"):
+        manual = (output / name).read_text(encoding="utf-8")
+        assert "9.9.9" in manual
+        assert "{{SYSTEM_VERSION}}" not in manual
+
+
+def test_run_batch_refuses_to_overwrite_templates(template_tree):
+    original = (template_tree / "sub" / "a.md").read_text(encoding="utf-8")
+
+    ok = gum.run_batch(str(template_tree), "**/*.md", str(template_tree / "sub"),
+                       False, REPLACEMENTS)
+
+    assert not ok
+    assert (template_tree / "sub" / "a.md").read_text(encoding="utf-8") == original
+    assert not (template_tree / "sub" / "sub").exists()
+
+
+def test_run_batch_validate_only_writes_nothing(template_tree, tmp_path, thread_pool):
+    output = tmp_path / "out"
+
+    ok = gum.run_batch(str(template_tree), "*.md", str(output), True, REPLACEMENTS)
+
+    assert ok
+    assert not output.exists()
+
+
+def test_batch_cli_uses_worker_processes(template_tree, tmp_path):
+    output = tmp_path / "out"
+
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "scripts" / "generate-user-manual.py"),
+         "--batch", str(template_tree), "--pattern", "**/*.md",
+         "--batch-output", str(output), "--system-version", "9.9.9"],
+        capture_output=True, text=True, encoding="utf-8",
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    for name in ("a.md", "sub/a.md"):
+        assert "9.9.9" in (output / name).read_text(encoding="utf-8")
+    # Each generated line follows its own template's header, in order
+    lines = result.stdout.splitlines()
+    first, second = (lines.index(f"✅ {template_tree / name}") for name in ("a.md", "sub/a.md"))
+    assert first < second
+    assert lines[first + 1] == f"✓ User manual generated: {output / 'a.md'}"
+    assert lines[second + 1] == f"✓ User manual generated: {output / 'sub' / 'a.md'}"
+    assert "2/2 templates passed" in lines[-1]
+
+
+def test_run_batch_without_matches_fails(tmp_path):
+    assert not gum.run_batch(str(tmp_path), "*.md", str(tmp_path / "out"), False, REPLACEMENTS)
+
+
+def test_nested_placeholders_are_all_reported():
+    generator = gum.UserManualGenerator()
+
+    generator.validate_content_quality("[TODO: fill] {{TODO}} [{{X}}]")
+
+    assert generator.validation_warnings[:3] == [
+        "Found placeholder content: ['{{TODO}}', '{{X}}']",
+        "Found placeholder content: ['[TODO: fill]', '[{{X}}]']",
+        "Found placeholder content: ['TODO', 'TODO']",
+    ]
+
+
+def test_heavily_padded_headers_are_recognised():
+    generator = gum.UserManualGenerator()
+    content = "".join(
+        f"##{' ' * 30}{section}{' ' * 30}\n" for section in gum.REQUIRED_SECTIONS
+    )
+
+    assert generator.validate_template_structure(content)
+    assert generator.validation_errors == []
+
+
+def test_load_template_normalises_line_endings(tmp_path):
+    path = tmp_path / "crlf.md"
+    path.write_bytes(b"## Overview\r\nline\rend\r\n")
+
+    assert gum.UserManualGenerator().load_template(str(path)) == "## Overview\nline\nend\n"
+
+
+def test_load_template_maps_large_files(tmp_path):
+    path = tmp_path / "large.md"
+    line = "## Overview – café\r\n"
+    repeats = gum._MMAP_THRESHOLD // len(line.encode("utf-8")) + 1
+    path.write_bytes((line * repeats).encode("utf-8"))
+    assert path.stat().st_size >= gum._MMAP_THRESHOLD
+
+    content = gum.UserManualGenerator().load_template(str(path))
+
+    assert content == "## Overview – café\n" * repeats
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_load_template_reads_pipes_to_eof(tmp_path):
+    path = tmp_path / "template.fifo"
+    os.mkfifo(path)
+    text = TEMPLATE.read_text(encoding="utf-8")
+
+    def feed():
+        with open(path, "w", encoding="utf-8") as pipe:
+            for start in range(0, len(text), 1000):
+                pipe.write(text[start:start + 1000])
+                pipe.flush()
+
+    writer = threading.Thread(target=feed)
+    writer.start()
+    try:
+        assert gum.UserManualGenerator().load_template(str(path)) == text
+    finally:
+        writer.join()
+
+
+def test_validation_summary_lists_present_sections_in_order():
+    generator = gum.UserManualGenerator()
+    content = "".join(
+        f"## {section}\n" for section in gum.REQUIRED_SECTIONS if section != "Feature Guide"
+    )
+
+    assert not generator.validate_template_structure(content)
+    summary = generator.generate_validation_summary()
+
+    assert summary["required_sections_present"] == [
+        "Overview", "Device Setup", "Troubleshooting", "Safety Guidelines",
+    ]
+    assert not summary["is_valid"]
+
+
+def _render(tmp_path, template, **replacements):
+    output = tmp_path / "manual.md"
+    assert gum.UserManualGenerator().generate_manual(template, str(output), **replacements)
+    return output.read_text(encoding="utf-8")
+
+
+def test_generate_manual_substitutes_in_a_single_pass(tmp_path):
+    # Values are inserted literally; a value containing another token is not
+    # expanded again
+    assert _render(tmp_path, "{{A}} {{B}}", A="{{B}}", B=1) == "{{B}} 1"
+
+
+def test_generate_manual_leaves_unknown_tokens(tmp_path):
+    assert _render(tmp_path, "{{A}} {{X}} {A}", A="a") == "a {{X}} {A}"
+
+
+def test_generate_manual_without_replacements_copies_template(tmp_path):
+    assert _render(tmp_path, "{{A}} text") == "{{A}} text"